@@ -1,6 +1,16 @@
+import numpy as np
 import pandas as pd
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    # Optional: fuses the whole comparison into one compiled pass over both
+    # columns for large numeric ID workloads
+    import numba
+    _HAVE_NUMBA = True
+except ImportError:
+    numba = None
+    _HAVE_NUMBA = False
+
 def compare_series(
     a: pd.Series,
     b: pd.Series,
@@ -40,94 +50,249 @@ def compare_series(
     if not isinstance(a, pd.Series) or not isinstance(b, pd.Series):
         raise TypeError("Both inputs must be pandas Series.")
 
-    # Capture NaN counts (treated separately)
-    na_count_a = int(a.isna().sum())
-    na_count_b = int(b.isna().sum())
-
-    # Series with or without NaNs for set-like operations
-    as_set = a.dropna() if dropna_for_sets else a
-    bs_set = b.dropna() if dropna_for_sets else b
-
-    # Build order of first appearance across both series to make result readable
-    def first_appearance_order(s: pd.Series) -> Dict[Any, int]:
-        # Use dict to keep first index per value
-        first_idx = {}
-        for i, v in enumerate(s.tolist()):
-            if v not in first_idx:
-                first_idx[v] = i
-        return first_idx
-
-    order_a = first_appearance_order(as_set)
-    order_b = first_appearance_order(bs_set)
-    # Combine orders: position in concatenated appearance
-    combined_order = {}
-    next_pos = 0
-    for source in (order_a, order_b):
-        for k in source:
-            if k not in combined_order:
-                combined_order[k] = next_pos
-                next_pos += 1
-
-    # Compute sets
-    set_a = set(as_set.tolist())
-    set_b = set(bs_set.tolist())
-    inter = set_a & set_b
-    only_a = set_a - set_b
-    only_b = set_b - set_a
-    uni = set_a | set_b
-    symdiff = set_a ^ set_b
-
-    # Value counts (include NaNs here for completeness)
-    vc_a = a.value_counts(dropna=False)
-    vc_b = b.value_counts(dropna=False)
-
-    # Details DataFrame indexed by union values, ordered by first appearance
-    union_vals_sorted = sorted(list(uni), key=lambda x: combined_order.get(x, float("inf")))
+    if (
+        _HAVE_NUMBA
+        and dropna_for_sets
+        and a.dtype == b.dtype
+        and a.dtype.kind in "if"
+    ):
+        # Numeric ID columns: one fused compiled pass over both arrays computes
+        # the appearance order, value counts and membership in a single scan
+        return _compare_series_numba(a, b, name_a, name_b)
+
+    # One scan per column: value_counts(sort=False, dropna=False) preserves
+    # first-appearance order, and the NaN counts, unique counts and unique values
+    # for the set operations all fall out of it without rescanning the series
+    vc_a = a.value_counts(dropna=False, sort=False)
+    vc_b = b.value_counts(dropna=False, sort=False)
+
+    # Categorical value_counts reports every category, including ones the
+    # series never contains; keep observed values only
+    if isinstance(a.dtype, pd.CategoricalDtype):
+        vc_a = vc_a[vc_a.values > 0]
+    if isinstance(b.dtype, pd.CategoricalDtype):
+        vc_b = vc_b[vc_b.values > 0]
+
+    na_mask_a = vc_a.index.isna()
+    na_mask_b = vc_b.index.isna()
+    na_count_a = int(vc_a[na_mask_a].sum())
+    na_count_b = int(vc_b[na_mask_b].sum())
+
+    # Unique values in first-appearance order, with or without NaNs for the
+    # set-like operations. Everything stays in pandas Index space: round-tripping
+    # through raw numpy arrays mangles datetime values into nanosecond ints.
+    idx_a = vc_a.index[~na_mask_a] if dropna_for_sets else vc_a.index
+    idx_b = vc_b.index[~na_mask_b] if dropna_for_sets else vc_b.index
+
+    if len(idx_a) == 0 or len(idx_b) == 0:
+        # Fast path: with an empty (or fully-NaN) side there are no overlaps,
+        # the combined order is just the non-empty side, and the hashtable set
+        # operations can be skipped entirely
+        combined = idx_a if len(idx_a) else idx_b
+        uni = combined
+        inter = combined[:0]
+        only_a = idx_a
+        only_b = idx_b
+        symdiff = combined
+    else:
+        # Appending the per-series uniques and de-duplicating again gives the
+        # combined appearance order
+        combined = idx_a.append(idx_b).unique()
+
+        # The ordering of these set-op results is irrelevant -- the ordered
+        # outputs below are membership filters over `combined`
+        if (
+            isinstance(idx_a.dtype, np.dtype)
+            and isinstance(idx_b.dtype, np.dtype)
+            and np.issubdtype(idx_a.dtype, np.number)
+            and np.issubdtype(idx_b.dtype, np.number)
+            and (dropna_for_sets or not (na_mask_a.any() or na_mask_b.any()))
+        ):
+            # Numeric ID columns (the common case): sort-merge in C on the
+            # typed arrays, no PyObject boxing. NaNs break the merge's equality
+            # assumptions, so columns that keep NaNs fall through to the
+            # hashtable path.
+            inter = pd.Index(np.intersect1d(idx_a, idx_b, assume_unique=True))
+            only_a = pd.Index(np.setdiff1d(idx_a, idx_b, assume_unique=True))
+            only_b = pd.Index(np.setdiff1d(idx_b, idx_a, assume_unique=True))
+            uni = pd.Index(np.union1d(idx_a, idx_b))
+            symdiff = pd.Index(np.setxor1d(idx_a, idx_b, assume_unique=True))
+        else:
+            # Compute set operations on the pd.Index objects, which dispatch to
+            # C hashtables over the underlying buffers instead of boxing every
+            # value into a Python set
+            inter = idx_a.intersection(idx_b)
+            only_a = idx_a.difference(idx_b)
+            only_b = idx_b.difference(idx_a)
+            uni = idx_a.union(idx_b)
+            symdiff = idx_a.symmetric_difference(idx_b)
+
+    # `combined` is already in first appearance order across both series.
+    # Reindex the value counts onto the union in one vectorized pass, then build
+    # all columns in a single DataFrame allocation -- no per-column insertions
+    union_idx = combined
+    counts_a = vc_a.reindex(union_idx, fill_value=0).to_numpy(dtype=np.int64)
+    counts_b = vc_b.reindex(union_idx, fill_value=0).to_numpy(dtype=np.int64)
+    in_a = counts_a > 0
+    in_b = counts_b > 0
+    in_both = in_a & in_b
     details = pd.DataFrame(
         {
-            f"count_in_{name_a}": [int(vc_a.get(v, 0)) for v in union_vals_sorted],
-            f"count_in_{name_b}": [int(vc_b.get(v, 0)) for v in union_vals_sorted],
+            f"count_in_{name_a}": counts_a,
+            f"count_in_{name_b}": counts_b,
+            f"in_{name_a}": in_a,
+            f"in_{name_b}": in_b,
+            "in_both": in_both,
+            f"only_in_{name_a}": in_a & ~in_b,
+            f"only_in_{name_b}": in_b & ~in_a,
         },
-        index=union_vals_sorted,
+        index=union_idx,
     )
-    details[f"in_{name_a}"] = details[f"count_in_{name_a}"] > 0
-    details[f"in_{name_b}"] = details[f"count_in_{name_b}"] > 0
-    details["in_both"] = details[f"in_{name_a}"] & details[f"in_{name_b}"]
-    details[f"only_in_{name_a}"] = details[f"in_{name_a}"] & (~details[f"in_{name_b}"])
-    details[f"only_in_{name_b}"] = details[f"in_{name_b}"] & (~details[f"in_{name_a}"])
 
     # Assemble counts summary
     counts_summary = {
-        f"n_{name_a}": int(len(a)),
-        f"n_{name_b}": int(len(b)),
-        f"n_unique_{name_a}": int(a.dropna().nunique()),
-        f"n_unique_{name_b}": int(b.dropna().nunique()),
-        f"n_overlap_values": int(len(inter)),
-        f"n_only_in_{name_a}": int(len(only_a)),
-        f"n_only_in_{name_b}": int(len(only_b)),
-        "n_union_values": int(len(uni)),
-        "n_symmetric_difference": int(len(symdiff)),
+        f"n_{name_a}": len(a),
+        f"n_{name_b}": len(b),
+        f"n_unique_{name_a}": int((~na_mask_a).sum()),
+        f"n_unique_{name_b}": int((~na_mask_b).sum()),
+        f"n_overlap_values": len(inter),
+        f"n_only_in_{name_a}": len(only_a),
+        f"n_only_in_{name_b}": len(only_b),
+        "n_union_values": len(uni),
+        "n_symmetric_difference": len(symdiff),
         f"na_count_{name_a}": na_count_a,
         f"na_count_{name_b}": na_count_b,
     }
 
+    # Ordered outputs come straight from the membership masks over union_idx;
+    # Python set lookups would miss NaN (a freshly boxed NaN is a different
+    # object from the one in the set)
     result = {
-        "intersection": _ordered_list(inter, combined_order),
-        "only_in_a": _ordered_list(only_a, combined_order),
-        "only_in_b": _ordered_list(only_b, combined_order),
-        "union": _ordered_list(uni, combined_order),
-        "symmetric_difference": _ordered_list(symdiff, combined_order),
+        "intersection": union_idx[in_both].tolist(),
+        "only_in_a": union_idx[in_a & ~in_b].tolist(),
+        "only_in_b": union_idx[in_b & ~in_a].tolist(),
+        "union": union_idx.tolist(),
+        "symmetric_difference": union_idx[~in_both].tolist(),
         "counts": counts_summary,
-        "value_counts_a": vc_a,
-        "value_counts_b": vc_b,
+        # Keep the familiar most-frequent-first presentation; sorting the unique
+        # values is cheap next to the full-column scan we saved
+        "value_counts_a": vc_a.sort_values(ascending=False),
+        "value_counts_b": vc_b.sort_values(ascending=False),
         "details": details,
     }
     return result
 
 
-def _ordered_list(values: set, order_map: Dict[Any, int]) -> List[Any]:
-    """Helper to return a set as a list ordered by first appearance."""
-    return sorted(list(values), key=lambda x: order_map.get(x, float("inf")))
+if _HAVE_NUMBA:
+    @numba.njit(cache=True)
+    def _compare_series_kernel(a_arr: np.ndarray, b_arr: np.ndarray):
+        """
+        Fused single-pass kernel: walk both arrays once, recording first
+        appearance order, per-value counts for each side and NaN counts.
+
+        Returns:
+            (values, count_a, count_b, na_a, na_b) where `values` holds the
+            distinct non-NaN values in first-appearance order and the count
+            arrays are aligned to it.
+        """
+        order = {}
+        n_est = len(a_arr) + len(b_arr)
+        vals = np.empty(n_est, dtype=a_arr.dtype)
+        count_a = np.zeros(n_est, dtype=np.int64)
+        count_b = np.zeros(n_est, dtype=np.int64)
+        na_a = 0
+        na_b = 0
+        k = 0
+        for v in a_arr:
+            if v != v:  # NaN (never true for integer arrays)
+                na_a += 1
+            elif v in order:
+                count_a[order[v]] += 1
+            else:
+                order[v] = k
+                vals[k] = v
+                count_a[k] = 1
+                k += 1
+        for v in b_arr:
+            if v != v:
+                na_b += 1
+            elif v in order:
+                count_b[order[v]] += 1
+            else:
+                order[v] = k
+                vals[k] = v
+                count_b[k] = 1
+                k += 1
+        return vals[:k], count_a[:k], count_b[:k], na_a, na_b
+
+
+def _value_counts_from_arrays(values: np.ndarray, counts: np.ndarray, na_count: int) -> pd.Series:
+    """Rebuild a value_counts(dropna=False)-shaped Series from kernel output."""
+    mask = counts > 0
+    idx = values[mask]
+    cnt = counts[mask]
+    if na_count:
+        idx = np.append(idx, np.nan)
+        cnt = np.append(cnt, na_count)
+    vc = pd.Series(cnt, index=idx, name="count")
+    return vc.sort_values(ascending=False)
+
+
+def _compare_series_numba(a: pd.Series, b: pd.Series, name_a: str, name_b: str) -> Dict[str, Any]:
+    """
+    Numba-backed implementation of compare_series for same-dtype numeric
+    columns with NaNs excluded from the set comparisons. Produces the same
+    result structure as the pandas path.
+    """
+    combined, counts_a, counts_b, na_count_a, na_count_b = _compare_series_kernel(
+        a.to_numpy(), b.to_numpy()
+    )
+    in_a = counts_a > 0
+    in_b = counts_b > 0
+    in_both = in_a & in_b
+    only_a = in_a & ~in_b
+    only_b = in_b & ~in_a
+
+    union_idx = pd.Index(combined)
+    details = pd.DataFrame(
+        {
+            f"count_in_{name_a}": counts_a,
+            f"count_in_{name_b}": counts_b,
+            f"in_{name_a}": in_a,
+            f"in_{name_b}": in_b,
+            "in_both": in_both,
+            f"only_in_{name_a}": only_a,
+            f"only_in_{name_b}": only_b,
+        },
+        index=union_idx,
+    )
+
+    counts_summary = {
+        f"n_{name_a}": len(a),
+        f"n_{name_b}": len(b),
+        f"n_unique_{name_a}": int(in_a.sum()),
+        f"n_unique_{name_b}": int(in_b.sum()),
+        f"n_overlap_values": int(in_both.sum()),
+        f"n_only_in_{name_a}": int(only_a.sum()),
+        f"n_only_in_{name_b}": int(only_b.sum()),
+        "n_union_values": len(combined),
+        "n_symmetric_difference": int((~in_both).sum()),
+        f"na_count_{name_a}": na_count_a,
+        f"na_count_{name_b}": na_count_b,
+    }
+
+    return {
+        "intersection": combined[in_both].tolist(),
+        "only_in_a": combined[only_a].tolist(),
+        "only_in_b": combined[only_b].tolist(),
+        "union": combined.tolist(),
+        "symmetric_difference": combined[~in_both].tolist(),
+        "counts": counts_summary,
+        "value_counts_a": _value_counts_from_arrays(combined, counts_a, na_count_a),
+        "value_counts_b": _value_counts_from_arrays(combined, counts_b, na_count_b),
+        "details": details,
+    }
+
 
 if __name__ == '__main__':
     # Example usage:
@@ -1,8 +1,10 @@
 import json
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Optional, Union
 
 import gspread
+import numpy as np
 import pandas as pd
+from pandas.io.clipboard import clipboard_set
 
 from config import get_google_service_account_key
 
@@ -30,9 +32,25 @@ class Spreadsheet:
 
             # Open the spreadsheet
             self.spreadsheet_gspread = self.sheets_client.open_by_key(spreadsheet_key)
+
+            # Cached title -> gspread worksheet map, refreshed lazily and
+            # invalidated by operations that change the worksheet list
+            self._ws_cache: Optional[Dict[str, gspread.Worksheet]] = None
         except Exception:
             raise
 
+    def _worksheets(self) -> Dict[str, gspread.Worksheet]:
+        """
+        Get the title -> gspread worksheet mapping, fetching it once and
+        reusing it until a mutating operation invalidates the cache.
+
+        Returns:
+            Dict mapping worksheet titles to gspread worksheet objects
+        """
+        if self._ws_cache is None:
+            self._ws_cache = {ws.title: ws for ws in self.spreadsheet_gspread.worksheets()}
+        return self._ws_cache
+
     def list_worksheets(self) -> List[str]:
         """
         List all worksheet (tab) names in the spreadsheet.
@@ -41,8 +59,7 @@ class Spreadsheet:
             List of worksheet names
         """
         try:
-            worksheets = self.spreadsheet_gspread.worksheets()
-            return [worksheet.title for worksheet in worksheets]
+            return list(self._worksheets())
         except Exception:
             return []
 
@@ -64,7 +81,9 @@ class Spreadsheet:
             if not self.worksheet_exists(worksheet_name):
                 raise gspread.exceptions.WorksheetNotFound(f"Worksheet '{worksheet_name}' not found")
 
-            return Worksheet(self, worksheet_name)
+            # Hand the cached gspread worksheet over so the wrapper doesn't
+            # need its own .worksheet(name) API call later
+            return Worksheet(self, worksheet_name, self._worksheets().get(worksheet_name))
         except Exception as e:
             raise
 
@@ -86,13 +105,31 @@ class Spreadsheet:
         try:
             # Create worksheet
             worksheet_gspread = self.spreadsheet_gspread.add_worksheet(title=worksheet_name, rows=rows, cols=cols)
-
-            # Make the first row bold, and add a freeze row for the top row
-            worksheet_gspread.format('A1:Z1', {'textFormat': {'bold': True}})
-            worksheet_gspread.freeze(rows=1)
+            self._ws_cache = None
+
+            # Make the first row bold, and add a freeze row for the top row,
+            # in a single batchUpdate instead of two separate round trips
+            sheet_id = worksheet_gspread.id
+            self.spreadsheet_gspread.batch_update({
+                "requests": [
+                    {
+                        "repeatCell": {
+                            "range": {"sheetId": sheet_id, "startRowIndex": 0, "endRowIndex": 1},
+                            "cell": {"userEnteredFormat": {"textFormat": {"bold": True}}},
+                            "fields": "userEnteredFormat.textFormat.bold",
+                        }
+                    },
+                    {
+                        "updateSheetProperties": {
+                            "properties": {"sheetId": sheet_id, "gridProperties": {"frozenRowCount": 1}},
+                            "fields": "gridProperties.frozenRowCount",
+                        }
+                    },
+                ]
+            })
 
             # Return our Worksheet wrapper
-            return Worksheet(self, worksheet_name)
+            return Worksheet(self, worksheet_name, worksheet_gspread)
         except Exception as e:
             raise
 
@@ -109,6 +146,7 @@ class Spreadsheet:
         try:
             worksheet = self.get_worksheet(name)
             self.spreadsheet_gspread.del_worksheet(worksheet.worksheet_gspread)
+            self._ws_cache = None
         except Exception as e:
             raise
 
@@ -123,8 +161,9 @@ class Spreadsheet:
             True if the worksheet exists, False otherwise
         """
         try:
-            worksheets = self.list_worksheets()
-            return name in worksheets
+            # O(1) hashtable membership against the cached title map -- no list
+            # scan and no API round trip on cache hits
+            return name in self._worksheets()
         except Exception:
             return False
 
@@ -142,6 +181,7 @@ class Spreadsheet:
         try:
             worksheet = self.get_worksheet(old_name)
             worksheet.worksheet_gspread.update_title(new_name)
+            self._ws_cache = None
         except Exception as e:
             raise
 
@@ -188,17 +228,20 @@ class Worksheet:
     handling the conversion between DataFrame objects and Google Sheets.
     """
 
-    def __init__(self, spreadsheet: Spreadsheet, sheet_name: str):
+    def __init__(self, spreadsheet: Spreadsheet, sheet_name: str,
+                 worksheet_gspread: Optional[gspread.Worksheet] = None):
         """
         Initialize a worksheet.
 
         Args:
             spreadsheet: Spreadsheet instance
             sheet_name: Name of the worksheet
+            worksheet_gspread: Already-fetched gspread worksheet object, if the
+                caller has one; avoids a lazy .worksheet(name) API call
         """
         self.spreadsheet = spreadsheet
         self.sheet_name = sheet_name
-        self._worksheet_gspread = None  # Cached worksheet object
+        self._worksheet_gspread = worksheet_gspread  # Cached worksheet object
 
     @property
     def worksheet_gspread(self):
@@ -238,21 +281,38 @@ class Worksheet:
         Returns:
             DataFrame containing all records
         """
-        records = self.read_all_records()
-        if records:
-            df = pd.DataFrame(records)
-
-            # Convert string date columns to datetime
-            for col in df.columns:
-                if col.endswith('_at') and df[col].dtype == 'object':
-                    try:
-                        df[col] = pd.to_datetime(df[col])
-                    except:
-                        pass  # Keep as string if conversion fails
-
-            return df
-        else:
-            return pd.DataFrame(columns=self.get_headers())
+        # A single values fetch serves both the headers and the data. Building
+        # the frame from the list of rows avoids gspread's per-row dict
+        # construction and pandas' dict-of-dicts inference path
+        values = self.worksheet_gspread.get_all_values()
+        headers = values[0] if values else []
+        rows = values[1:]
+        if not rows:
+            return pd.DataFrame(columns=headers)
+
+        df = pd.DataFrame(rows, columns=headers)
+
+        # get_all_values returns everything as text; restore numeric columns
+        # (whole-column conversions only, mirroring get_all_records)
+        for col in df.columns:
+            if col.endswith('_at') or df[col].dtype != 'object':
+                continue
+            try:
+                df[col] = pd.to_numeric(df[col])
+            except (ValueError, TypeError):
+                pass  # Keep as text if the column isn't fully numeric
+
+        # Convert string date columns to datetime in one vectorized pass,
+        # keeping a column as text only when nothing in it parses
+        date_cols = [col for col in df.columns if col.endswith('_at') and df[col].dtype == 'object']
+        if date_cols:
+            parsed = df[date_cols].apply(pd.to_datetime, errors='coerce')
+            keep = parsed.notna().any()
+            for col in date_cols:
+                if keep[col]:
+                    df[col] = parsed[col]
+
+        return df
 
     def append_rows(self, values: List[List[Any]]) -> None:
         """
@@ -282,16 +342,20 @@ class Worksheet:
             Exception: If there are no headers or if named range creation fails
         """
         try:
-            headers = self.get_headers()
+            # A single values fetch covers both the header row and the data
+            # extent, instead of a row_values(1) round trip plus a full read
+            all_values = self.worksheet_gspread.get_all_values()
+            headers = all_values[0] if all_values else []
             if not headers:
                 raise ValueError("No headers found in the worksheet")
 
             # If data_end_row not specified, find the last row with data
             if data_end_row is None:
-                all_values = self.worksheet_gspread.get_all_values()
-                data_end_row = len(all_values) if all_values else data_start_row
+                data_end_row = len(all_values)
 
             created_ranges = {}
+            requests = []
+            sheet_id = self.worksheet_gspread.id
             for col_index, header in enumerate(headers):
                 if header.strip():  # Only create ranges for non-empty headers
                     # Use gspread's utils to convert column index to letter notation
@@ -309,15 +373,20 @@ class Worksheet:
                         range_name = f"col_{range_name}"
 
                     if range_name:  # Only create if we have a valid name
-                        try:
-                            self.worksheet_gspread.define_named_range(
-                                name=range_notation,
-                                range_name=range_name
-                            )
-                            created_ranges[header] = range_notation
-                        except Exception as e:
-                            print(f"Warning: Could not create named range for '{header}': {e}")
-                            continue
+                        requests.append({
+                            "addNamedRange": {
+                                "namedRange": {
+                                    "name": range_name,
+                                    "range": gspread.utils.a1_range_to_grid_range(range_notation, sheet_id),
+                                }
+                            }
+                        })
+                        created_ranges[header] = range_notation
+
+            # Create every named range in a single batchUpdate round trip
+            # instead of one API request per header
+            if requests:
+                self.spreadsheet.spreadsheet_gspread.batch_update({"requests": requests})
 
             return created_ranges
 
@@ -342,6 +411,7 @@ class Worksheet:
             responses: Dict[str, Any] = {}
             errors: Dict[str, str] = {}
 
+            nr_ids = []
             for nr in named_ranges:
                 # Be defensive about the structure returned by gspread
                 nr_id = None
@@ -361,12 +431,21 @@ class Worksheet:
                 if not nr_id:
                     # Skip entries we cannot identify
                     continue
+                nr_ids.append(nr_id)
 
+            # Delete every named range in a single batchUpdate round trip
+            # instead of one API request per range
+            if nr_ids:
+                requests = [{"deleteNamedRange": {"namedRangeId": nr_id}} for nr_id in nr_ids]
                 try:
-                    resp = self.worksheet_gspread.delete_named_range(nr_id)
-                    responses[nr_id] = resp
+                    resp = self.spreadsheet.spreadsheet_gspread.batch_update({"requests": requests})
+                    replies = (resp or {}).get("replies") or []
+                    for i, nr_id in enumerate(nr_ids):
+                        responses[nr_id] = replies[i] if i < len(replies) else resp
                 except Exception as e:
-                    errors[nr_id] = str(e)
+                    # batchUpdate is atomic: a failure means nothing was deleted
+                    for nr_id in nr_ids:
+                        errors[nr_id] = str(e)
 
             return {
                 "deleted_ids": list(responses.keys()),
@@ -409,15 +488,57 @@ class Worksheet:
             except Exception:
                 return 2, s.casefold()
 
-        list_a = _fetch_1d_list(range_a)
-        list_b = _fetch_1d_list(range_b)
+        def _lexsorted(values: List[str]):
+            # Decompose the sort key into parallel columns (type tag, numeric
+            # value, casefolded text) and let np.lexsort order them in C
+            # instead of comparing Python tuples. lexsort is stable, so ties
+            # keep their fetch order just like list.sort did. Also returns the
+            # dense rank of each sorted element (equal sort keys share a rank)
+            # for the pair-level ordering below.
+            if len(values) < 2:
+                return values, np.zeros(len(values), dtype=np.int64)
+            keys = [_sort_key(v) for v in values]
+            tags = np.fromiter((k[0] for k in keys), dtype=np.int64, count=len(keys))
+            nums = np.fromiter((k[1] if k[0] == 1 else 0.0 for k in keys), dtype=np.float64, count=len(keys))
+            texts = np.array([k[1] if k[0] == 2 else "" for k in keys])
+            order = np.lexsort((texts, nums, tags))
+            sorted_keys = [keys[i] for i in order]
+            ranks = np.empty(len(order), dtype=np.int64)
+            ranks[0] = 0
+            for i in range(1, len(sorted_keys)):
+                ranks[i] = ranks[i - 1] + (sorted_keys[i] != sorted_keys[i - 1])
+            return [values[i] for i in order], ranks
+
+        # Sort each side once (|A| + |B| key computations instead of two per
+        # pair comparison)
+        list_a, ranks_a = _lexsorted(_fetch_1d_list(range_a))
+        list_b, ranks_b = _lexsorted(_fetch_1d_list(range_b))
 
         pairs: List[List[Any]] = []
+        text = ""
         if list_a and list_b:
-            pairs = [[a, b] for a in list_a for b in list_b]
-            pairs.sort(key=lambda p: (_sort_key(p[0]), _sort_key(p[1])))
-
-        # Copy via pandas to clipboard as TSV (n x 2) without headers or index
-        df = pd.DataFrame(pairs)
-        df.to_clipboard(index=False, header=False)
+            # Build the cross product as two flat numpy arrays (repeat/tile)
+            # instead of |A|x|B| nested Python lists
+            arr_a = np.asarray(list_a)
+            arr_b = np.asarray(list_b)
+            pairs_a = np.repeat(arr_a, len(arr_b))
+            pairs_b = np.tile(arr_b, len(arr_a))
+
+            # Pre-sorted sides are not enough when a side contains duplicate
+            # (or sort-key-equal) values: each copy's block stays contiguous,
+            # breaking the "ascending by first column, then second" contract.
+            # A stable lexsort over the repeated/tiled dense ranks regroups
+            # them; when both sides are duplicate-free the layout is already
+            # sorted and the pass can be skipped.
+            if ranks_a[-1] + 1 < len(ranks_a) or ranks_b[-1] + 1 < len(ranks_b):
+                order = np.lexsort((np.tile(ranks_b, len(arr_a)), np.repeat(ranks_a, len(arr_b))))
+                pairs_a = pairs_a[order]
+                pairs_b = pairs_b[order]
+
+            # Copy as TSV (n x 2) without headers or index, joined with C-level
+            # string ops rather than per-pair Python formatting
+            text = "\n".join(np.char.add(np.char.add(pairs_a, "\t"), pairs_b))
+            pairs = [list(p) for p in zip(pairs_a.tolist(), pairs_b.tolist())]
+
+        clipboard_set(text)
         return pairs